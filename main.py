@@ -6,7 +6,10 @@ Entry point for the application.
 
 import sys
 import argparse
+import asyncio
+import importlib.util
 import logging
+from importlib import metadata
 from pathlib import Path
 
 # Add src to path for imports
@@ -14,7 +17,6 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from src.utils import setup_logging, show_error_dialog, show_success_dialog, show_warning_dialog
 from src.config_manager import load_config, check_provider_credentials
-from src.llm_providers import create_provider
 
 logger = None  # Will be initialized after argument parsing
 
@@ -53,6 +55,22 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _package_version(distribution: str) -> str:
+    """
+    Look up an installed distribution's version without importing it.
+    
+    Args:
+        distribution: Distribution name as published on PyPI
+        
+    Returns:
+        Version string, or "unknown" if metadata is unavailable
+    """
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
 def validate_environment() -> dict:
     """
     Run comprehensive environment validation.
@@ -73,40 +91,36 @@ def validate_environment() -> dict:
     # Check Python version (3.10+)
     if sys.version_info >= (3, 10):
         results['python_version'] = True
-        logger.info(f"[OK] Python version: {sys.version.split()[0]}")
+        logger.info("[OK] Python version: %s", sys.version.split()[0])
     else:
-        logger.error(f"[FAIL] Python version {sys.version.split()[0]} < 3.10")
+        logger.error("[FAIL] Python version %s < 3.10", sys.version.split()[0])
     
-    # Check pygame-ce
-    try:
-        import pygame
+    # Check pygame-ce (find_spec confirms presence without paying for the import)
+    if importlib.util.find_spec("pygame") is not None:
         results['pygame_ce'] = True
-        logger.info(f"[OK] pygame-ce installed: {pygame.version.ver}")
-    except ImportError:
+        logger.info("[OK] pygame-ce installed: %s", _package_version('pygame-ce'))
+    else:
         logger.error("[FAIL] pygame-ce not installed")
     
     # Check pygame_gui
-    try:
-        import pygame_gui
+    if importlib.util.find_spec("pygame_gui") is not None:
         results['pygame_gui'] = True
-        logger.info(f"[OK] pygame_gui installed")
-    except ImportError:
+        logger.info("[OK] pygame_gui installed")
+    else:
         logger.error("[FAIL] pygame_gui not installed")
     
     # Check requests
-    try:
-        import requests
+    if importlib.util.find_spec("requests") is not None:
         results['requests'] = True
-        logger.info(f"[OK] requests installed: {requests.__version__}")
-    except ImportError:
+        logger.info("[OK] requests installed: %s", _package_version('requests'))
+    else:
         logger.error("[FAIL] requests not installed")
     
     # Check python-dotenv
-    try:
-        import dotenv
+    if importlib.util.find_spec("dotenv") is not None:
         results['dotenv'] = True
-        logger.info(f"[OK] python-dotenv installed")
-    except ImportError:
+        logger.info("[OK] python-dotenv installed")
+    else:
         logger.error("[FAIL] python-dotenv not installed")
     
     # Try to load config
@@ -130,10 +144,10 @@ def validate_environment() -> dict:
                 if ollama.is_available():
                     results['ollama_server'] = True
                     models = ollama.list_models()
-                    logger.info(f"[OK] Ollama server running with {len(models)} models")
+                    logger.info("[OK] Ollama server running with %d models", len(models))
 
                     if models:
-                        logger.info(f"  Available models: {', '.join(models)}")
+                        logger.info("  Available models: %s", ', '.join(models))
                     else:
                         logger.warning("  [WARN] No models downloaded. Run: ollama pull llama3.2:3b")
                 else:
@@ -141,7 +155,7 @@ def validate_environment() -> dict:
                     logger.info("  Start it with: ollama serve")
                     
             except Exception as e:
-                logger.error(f"[FAIL] Error checking Ollama: {e}")
+                logger.error("[FAIL] Error checking Ollama: %s", e)
         else:
             logger.info("[SKIP] Ollama disabled in config")
         
@@ -152,12 +166,12 @@ def validate_environment() -> dict:
                 continue
             
             if has_key:
-                logger.info(f"[OK] {provider.title()} API key found")
+                logger.info("[OK] %s API key found", provider.title())
             else:
-                logger.warning(f"[WARN] {provider.title()} enabled but no API key")
+                logger.warning("[WARN] %s enabled but no API key", provider.title())
         
     except Exception as e:
-        logger.error(f"[FAIL] Config error: {e}")
+        logger.error("[FAIL] Config error: %s", e)
 
     return results
 
@@ -214,6 +228,40 @@ def print_diagnostic_report(results: dict) -> None:
     print("="*60 + "\n")
 
 
+async def init_providers(enabled_providers: dict) -> list:
+    """
+    Create providers and run their health checks concurrently.
+    
+    Each is_available() call blocks on network I/O, so probes run in worker
+    threads and startup waits for the slowest provider rather than the sum.
+    
+    Args:
+        enabled_providers: Dict mapping provider names to their configs
+        
+    Returns:
+        List in config order of (provider, is_available) tuples, or the
+        exception raised while creating that provider
+    """
+    from src.llm_providers import create_provider
+    
+    async def init_one(provider_name: str, provider_config: dict):
+        provider = create_provider(provider_name, provider_config)
+        
+        # A failing health check still leaves the provider registered
+        try:
+            available = await asyncio.to_thread(provider.is_available)
+        except Exception as e:
+            logger.warning("Health check for %s failed: %s", provider_name, e)
+            available = False
+        
+        return provider, available
+    
+    return await asyncio.gather(
+        *(init_one(name, cfg) for name, cfg in enabled_providers.items()),
+        return_exceptions=True
+    )
+
+
 def main() -> int:
     """
     Main entry point.
@@ -247,7 +295,7 @@ def main() -> int:
     # Load configuration
     try:
         config = load_config(args.config)
-        logger.info(f"Loaded configuration from {args.config}")
+        logger.info("Loaded configuration from %s", args.config)
     except Exception as e:
         show_error_dialog(f"Failed to load configuration: {e}")
         return 1
@@ -259,20 +307,25 @@ def main() -> int:
         enabled_providers = get_enabled_providers(config)
         providers = {}
         
-        for provider_name, provider_config in enabled_providers.items():
-            try:
-                provider = create_provider(provider_name, provider_config)
-                providers[provider_name] = provider
-                logger.info(f"Initialized provider: {provider.name}")
-                
-                # Test availability
-                if provider.is_available():
-                    logger.info(f"  [OK] {provider.name} is available")
-                else:
-                    logger.warning(f"  [WARN] {provider.name} not responding")
-                    
-            except Exception as e:
-                logger.error(f"Failed to initialize {provider_name}: {e}")
+        # Probe all providers concurrently; gather preserves config order
+        results = asyncio.run(init_providers(enabled_providers))
+        
+        for provider_name, result in zip(enabled_providers, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to initialize %s: %s", provider_name, result)
+                continue
+            if isinstance(result, BaseException):
+                # KeyboardInterrupt, CancelledError etc. must not be swallowed
+                raise result
+            
+            provider, available = result
+            providers[provider_name] = provider
+            logger.info("Initialized provider: %s", provider.name)
+            
+            if available:
+                logger.info("  [OK] %s is available", provider.name)
+            else:
+                logger.warning("  [WARN] %s not responding", provider.name)
         
         if not providers:
             show_warning_dialog(
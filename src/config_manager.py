@@ -8,8 +8,16 @@ from typing import Dict, Any, Tuple, Optional
 from urllib.parse import urlparse
 import os
 
+from . import __version__
+
 logger = logging.getLogger("pixelprompt.config")
 
+# Merged + validated config from the last load, keyed by file path/mtime/size
+CONFIG_CACHE_PATH = Path.home() / ".cache" / "pixelprompt" / "config_cache.json"
+
+# Agent colors must be #RRGGBB with valid hex digits
+HEX_COLOR_PATTERN = re.compile(r'#[0-9A-Fa-f]{6}')
+
 
 def get_default_config() -> Dict[str, Any]:
     """
@@ -111,10 +119,22 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
         save_config(config_path, config)
         return config
     
+    # Stat before reading so a save during the load can't be cached under
+    # the new mtime/size with the old contents
+    cache_key = _cache_key(config_file)
+    
+    # Skip parse/merge/validate when the file hasn't changed since last load
+    cached = _load_cached(cache_key)
+    if cached is not None:
+        logger.info(f"Loaded config from {config_path} (cached)")
+        warn_if_no_providers(cached)
+        return cached
+    
     # Try to load existing config
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        # One read() of raw bytes; json.loads detects the UTF encoding itself
+        with open(config_file, 'rb') as f:
+            config = json.loads(f.read())
         
         logger.info(f"Loaded config from {config_path}")
         
@@ -123,6 +143,9 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
         
         # Validate the merged config
         validate_config(config)
+        warn_if_no_providers(config)
+        
+        _store_cached(cache_key, config)
         
         return config
         
@@ -146,6 +169,68 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
         raise
 
 
+def _cache_key(config_file: Path) -> Tuple[str, int, int, str]:
+    """
+    Build the cache key identifying a config file's current contents.
+    
+    Args:
+        config_file: Path to config file
+        
+    Returns:
+        Tuple of (resolved path, mtime in ns, size in bytes, app version)
+    """
+    stat = config_file.stat()
+    return (str(config_file.resolve()), stat.st_mtime_ns, stat.st_size, __version__)
+
+
+def _load_cached(cache_key: Tuple[str, int, int, str]) -> Optional[Dict[str, Any]]:
+    """
+    Return the cached config for a file if it is still up to date.
+    
+    Args:
+        cache_key: Key of the config file's current contents (see _cache_key)
+        
+    Returns:
+        Cached configuration dictionary, or None on a cache miss
+    """
+    try:
+        with open(CONFIG_CACHE_PATH, 'rb') as f:
+            entry = json.loads(f.read())
+        
+        # JSON has no tuples, so the stored key comes back as a list
+        if entry["key"] == list(cache_key):
+            return entry["config"]
+            
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # A stale or corrupted cache is never fatal - just re-parse
+        logger.debug(f"Ignoring unreadable config cache: {e}")
+    
+    return None
+
+
+def _store_cached(cache_key: Tuple[str, int, int, str], config: Dict[str, Any]) -> None:
+    """
+    Cache a validated config keyed by the file it was loaded from.
+    
+    Args:
+        cache_key: Key taken before the config file was read (see _cache_key)
+        config: Merged and validated configuration dictionary
+    """
+    try:
+        CONFIG_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write to a temp file first so a crash never leaves a torn cache
+        tmp_path = CONFIG_CACHE_PATH.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"key": cache_key, "config": config}, f)
+        os.replace(tmp_path, CONFIG_CACHE_PATH)
+        
+    except OSError as e:
+        logger.debug(f"Could not write config cache: {e}")
+
+
 def save_config(config_path: str, config: Dict[str, Any]) -> None:
     """
     Save configuration to JSON file.
@@ -177,21 +262,20 @@ def merge_with_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Merged configuration
     """
-    defaults = get_default_config()
+    result = get_default_config()
     
-    def deep_merge(base: Dict, override: Dict) -> Dict:
-        """Recursively merge dictionaries."""
-        result = base.copy()
-        
+    # Walk nested dicts iteratively. The defaults are freshly built on every
+    # call, so they can be merged into in place without copying subtrees.
+    stack = [(result, config)]
+    while stack:
+        base, override = stack.pop()
         for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = deep_merge(result[key], value)
+            if isinstance(value, dict) and isinstance(base.get(key), dict):
+                stack.append((base[key], value))
             else:
-                result[key] = value
-        
-        return result
+                base[key] = value
     
-    return deep_merge(defaults, config)
+    return result
 
 
 def validate_config(config: Dict[str, Any]) -> None:
@@ -219,12 +303,7 @@ def validate_config(config: Dict[str, Any]) -> None:
     if not (10 <= window["fps_target"] <= 240):
         raise ValueError(f"Invalid FPS target: {window['fps_target']}")
     
-    # Validate at least one enabled provider
     providers = config["llm_providers"]
-    enabled_providers = [name for name, cfg in providers.items() if cfg.get("enabled", False)]
-    
-    if not enabled_providers:
-        logger.warning("No LLM providers enabled - you won't be able to chat with agents")
     
     # Validate agents
     if not config["agents"]:
@@ -243,7 +322,7 @@ def validate_config(config: Dict[str, Any]) -> None:
         
         # Validate color hex (must be #RRGGBB with valid hex digits)
         color = agent["color_hex"]
-        if not re.match(r'^#[0-9A-Fa-f]{6}$', color):
+        if not isinstance(color, str) or not HEX_COLOR_PATTERN.fullmatch(color):
             raise ValueError(f"Invalid color hex: {color}. Expected format: #RRGGBB with valid hex digits")
 
         # Validate spawn_position is [x, y] with valid coordinates
@@ -314,6 +393,19 @@ def get_fps_target(config: Dict[str, Any]) -> int:
     return config["window"]["fps_target"]
 
 
+def warn_if_no_providers(config: Dict[str, Any]) -> None:
+    """
+    Log a warning if no LLM provider is enabled.
+    
+    Kept out of validate_config() so it also runs on cached loads.
+    
+    Args:
+        config: Configuration dictionary
+    """
+    if not get_enabled_providers(config):
+        logger.warning("No LLM providers enabled - you won't be able to chat with agents")
+
+
 def get_enabled_providers(config: Dict[str, Any]) -> Dict[str, Dict]:
     """
     Get dictionary of enabled providers with their configs.
@@ -59,6 +59,15 @@ class BaseLLMProvider(ABC):
     def name(self) -> str:
         """Provider display name (e.g., "Ollama", "Google Gemini")."""
         pass
+    
+    def close(self) -> None:
+        """
+        Release any pooled connections held by this provider.
+        
+        The default implementation does nothing; providers that keep an HTTP
+        session open override this.
+        """
+        pass
 
 
 def create_provider(provider_name: str, config: Dict) -> BaseLLMProvider:
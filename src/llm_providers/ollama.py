@@ -2,17 +2,87 @@
 
 import json
 import logging
-from typing import Generator, List, Dict
+import time
+from typing import Generator, Iterator, List, Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter
 
 from . import BaseLLMProvider
 
+# orjson is an optional speedup for chunk parsing and request bodies; its
+# JSONDecodeError subclasses json.JSONDecodeError, so handlers work with either
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 logger = logging.getLogger("pixelprompt.llm.ollama")
 
 # Stream safeguards to prevent runaway responses
 MAX_RESPONSE_CHUNKS = 10000  # Maximum chunks to process
 MAX_RESPONSE_LENGTH = 100000  # Maximum total response length in characters
 
+# Health checks fail fast so an unreachable server doesn't stall startup
+HEALTH_CHECK_TIMEOUT = (0.5, 2.0)  # (connect, read) seconds
+
+# How long health-check and model-list results are reused (seconds)
+AVAILABILITY_CACHE_TTL = 2.0
+MODELS_CACHE_TTL = 10.0
+
+# Connection pool sizing - enough keep-alive sockets for several agents
+# streaming from the same server at once
+POOL_CONNECTIONS = 4  # Distinct hosts to keep pools for
+POOL_MAXSIZE = 16  # Keep-alive connections per host
+
+# Socket read size for streamed NDJSON responses
+STREAM_CHUNK_SIZE = 65536
+
+# Request bodies are serialized up front and sent as bytes, so requests sets
+# Content-Length and http.client sends headers and body in a single write
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Token streams are requested uncompressed: a gzip stream would buffer small
+# chunks in the encoder and delay the first token. Bulk endpoints keep the
+# session's default gzip/deflate Accept-Encoding.
+CHAT_STREAM_HEADERS = {**JSON_HEADERS, "Accept-Encoding": "identity"}
+
+
+def _iter_ndjson_lines(response: requests.Response) -> Iterator[bytes]:
+    """
+    Yield complete lines from a streamed NDJSON response.
+    
+    Reads in large chunks and splits on newlines in a single bytearray, so a
+    burst of tokens costs one read instead of one per 512 bytes. Ollama sends
+    chunked transfer encoding, so each HTTP chunk is still delivered as soon
+    as it arrives.
+    
+    Args:
+        response: Response opened with stream=True
+        
+    Yields:
+        bytes: One line without its trailing newline (may be empty)
+    """
+    buffer = bytearray()
+    
+    for data in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+        buffer += data
+        start = 0
+        
+        while (end := buffer.find(b"\n", start)) != -1:
+            yield bytes(buffer[start:end])
+            start = end + 1
+        
+        del buffer[:start]
+    
+    # Final line without a trailing newline
+    if buffer:
+        yield bytes(buffer)
+
 
 class OllamaProvider(BaseLLMProvider):
     """Local Ollama provider for free, offline inference."""
@@ -27,13 +97,31 @@ class OllamaProvider(BaseLLMProvider):
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        logger.info(f"Initialized OllamaProvider with base_url={self.base_url}")
+        
+        # Reuse one keep-alive connection pool across all requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=0
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        
+        # (monotonic timestamp, result) of the last probe / model listing
+        self._availability_cache: Optional[Tuple[float, bool]] = None
+        self._models_cache: Optional[Tuple[float, List[str]]] = None
+        logger.info("Initialized OllamaProvider with base_url=%s", self.base_url)
     
     @property
     def name(self) -> str:
         """Provider display name."""
         return "Ollama"
     
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+    
     def send_message(self, 
                     messages: List[Dict[str, str]], 
                     model: str,
@@ -66,54 +154,64 @@ class OllamaProvider(BaseLLMProvider):
         if kwargs:
             payload.update(kwargs)
         
-        logger.debug(f"Sending request to {url} with model={model}")
+        logger.debug("Sending request to %s with model=%s", url, model)
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url, 
-                json=payload, 
+                data=_json_dumps(payload), 
+                headers=CHAT_STREAM_HEADERS,
                 stream=True, 
                 timeout=self.timeout
             )
             response.raise_for_status()
             
-            # Stream chunks with safeguards
-            chunk_count = 0
-            total_length = 0
-
-            for line in response.iter_lines():
-                if line:
-                    chunk_count += 1
-
-                    # Safeguard: limit number of chunks
-                    if chunk_count > MAX_RESPONSE_CHUNKS:
-                        logger.warning(f"Response exceeded {MAX_RESPONSE_CHUNKS} chunks, truncating")
-                        break
-
-                    try:
-                        chunk = json.loads(line)
-
-                        # Extract content from message
-                        if 'message' in chunk and 'content' in chunk['message']:
-                            content = chunk['message']['content']
-                            if content:  # Only yield non-empty content
-                                total_length += len(content)
-
-                                # Safeguard: limit total response length
-                                if total_length > MAX_RESPONSE_LENGTH:
-                                    logger.warning(f"Response exceeded {MAX_RESPONSE_LENGTH} chars, truncating")
-                                    break
-
-                                yield content
-
-                        # Check if done
-                        if chunk.get('done', False):
-                            logger.debug("Stream completed")
+            with response:
+                # Stream chunks with safeguards
+                chunk_count = 0
+                total_length = 0
+                parse_errors = 0
+
+                for line in _iter_ndjson_lines(response):
+                    if line:
+                        chunk_count += 1
+
+                        # Safeguard: limit number of chunks
+                        if chunk_count > MAX_RESPONSE_CHUNKS:
+                            logger.warning("Response exceeded %d chunks, truncating", MAX_RESPONSE_CHUNKS)
                             break
 
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"Failed to parse chunk: {e}")
-                        continue
+                        try:
+                            chunk = _json_loads(line)
+
+                            # Extract content from message
+                            if 'message' in chunk and 'content' in chunk['message']:
+                                content = chunk['message']['content']
+                                if content:  # Only yield non-empty content
+                                    total_length += len(content)
+
+                                    # Safeguard: limit total response length
+                                    if total_length > MAX_RESPONSE_LENGTH:
+                                        logger.warning("Response exceeded %d chars, truncating", MAX_RESPONSE_LENGTH)
+                                        break
+
+                                    yield content
+
+                            # Check if done
+                            if chunk.get('done', False):
+                                logger.debug("Stream completed")
+                                break
+
+                        except json.JSONDecodeError as e:
+                            # Log only the first failure so a misbehaving
+                            # server can't flood the log from the hot loop
+                            parse_errors += 1
+                            if parse_errors == 1:
+                                logger.warning("Failed to parse chunk: %s", e)
+                            continue
+                
+                if parse_errors > 1:
+                    logger.warning("Skipped %d unparseable chunks in response", parse_errors)
             
         except requests.ConnectionError as e:
             error_msg = f"Cannot reach Ollama at {self.base_url}"
@@ -152,36 +250,53 @@ class OllamaProvider(BaseLLMProvider):
         """
         Check if Ollama server is running.
         
+        Results are reused for AVAILABILITY_CACHE_TTL seconds so that
+        status polling doesn't turn into a stream of /api/tags requests.
+        
         Returns:
             bool: True if server is reachable
         """
+        now = time.monotonic()
+        cached = self._availability_cache
+        if cached is not None and now - cached[0] < AVAILABILITY_CACHE_TTL:
+            return cached[1]
+        
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/tags", 
-                timeout=5
+                timeout=HEALTH_CHECK_TIMEOUT
             )
             available = response.status_code == 200
             
             if available:
                 logger.debug("Ollama server is available")
             else:
-                logger.warning(f"Ollama server returned status {response.status_code}")
-            
-            return available
+                logger.warning("Ollama server returned status %d", response.status_code)
             
         except requests.RequestException as e:
-            logger.warning(f"Ollama not available: {e}")
-            return False
+            logger.warning("Ollama not available: %s", e)
+            available = False
+        
+        self._availability_cache = (now, available)
+        return available
     
     def list_models(self) -> List[str]:
         """
         Get list of downloaded models from Ollama.
         
+        Successful listings are reused for MODELS_CACHE_TTL seconds and
+        refreshed after pull_model() completes.
+        
         Returns:
             List[str]: Model names
         """
+        now = time.monotonic()
+        cached = self._models_cache
+        if cached is not None and now - cached[0] < MODELS_CACHE_TTL:
+            return list(cached[1])
+        
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/api/tags",
                 timeout=5
             )
@@ -190,11 +305,12 @@ class OllamaProvider(BaseLLMProvider):
             data = response.json()
             models = [m['name'] for m in data.get('models', [])]
             
-            logger.debug(f"Available models: {models}")
-            return models
+            logger.debug("Available models: %s", models)
+            self._models_cache = (now, models)
+            return list(models)
             
         except requests.RequestException as e:
-            logger.error(f"Failed to list models: {e}")
+            logger.error("Failed to list models: %s", e)
             return []
     
     def pull_model(self, model: str) -> bool:
@@ -210,30 +326,41 @@ class OllamaProvider(BaseLLMProvider):
         url = f"{self.base_url}/api/pull"
         payload = {"name": model}
         
-        logger.info(f"Pulling model: {model}")
+        logger.info("Pulling model: %s", model)
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 url,
-                json=payload,
+                data=_json_dumps(payload),
+                headers=JSON_HEADERS,
                 stream=True,
                 timeout=300  # 5 minutes for large models
             )
             response.raise_for_status()
             
-            # Stream progress updates
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        chunk = json.loads(line)
-                        if 'status' in chunk:
-                            logger.info(f"Pull status: {chunk['status']}")
-                    except json.JSONDecodeError:
-                        continue
+            with response:
+                # Stream progress updates
+                parse_errors = 0
+                
+                for line in _iter_ndjson_lines(response):
+                    if line:
+                        try:
+                            chunk = _json_loads(line)
+                            if 'status' in chunk:
+                                logger.info("Pull status: %s", chunk['status'])
+                        except json.JSONDecodeError:
+                            parse_errors += 1
+                            continue
+                
+                if parse_errors:
+                    logger.debug("Skipped %d unparseable pull status lines", parse_errors)
+            
+            # The model list just changed
+            self._models_cache = None
             
-            logger.info(f"Successfully pulled model: {model}")
+            logger.info("Successfully pulled model: %s", model)
             return True
             
         except requests.RequestException as e:
-            logger.error(f"Failed to pull model: {e}")
+            logger.error("Failed to pull model: %s", e)
             return False
@@ -1,16 +1,27 @@
 """Utility functions and logging setup for PixelPrompt."""
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 from datetime import datetime
 
+# Background thread that performs file writes for the app logger
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> logging.Logger:
     """
     Configure logging for the application.
     
+    File writes are handed to a queue and performed by a background listener
+    thread, so logging never blocks the caller on disk I/O. Console output
+    stays synchronous so it keeps its order relative to print() calls.
+    
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path. If None, uses logs/pixelprompt.log
@@ -18,6 +29,8 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     Returns:
         Configured logger instance
     """
+    global _log_listener
+    
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
@@ -33,6 +46,8 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
     
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    if _log_listener is not None:
+        _log_listener.stop()
     
     # Console handler with color coding
     console_handler = logging.StreamHandler(sys.stdout)
@@ -42,7 +57,6 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
         datefmt='%H:%M:%S'
     )
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
     
     # File handler with detailed formatting
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
@@ -52,12 +66,34 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> lo
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    
+    # Console writes happen on the caller's thread so they interleave
+    # correctly with print(); only the file handler sits behind the queue
+    logger.addHandler(console_handler)
+    
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _log_listener.start()
     
     logger.info(f"Logging initialized - Level: {log_level}, File: {log_file}")
     return logger
 
 
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _log_listener
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color coding for console output."""
     
@@ -71,14 +107,28 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
     
+    def __init__(self, *args, **kwargs):
+        """Initialize formatter and precompute colored level names."""
+        super().__init__(*args, **kwargs)
+        
+        reset = self.COLORS['RESET']
+        self._colored_levelnames = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != 'RESET'
+        }
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors."""
-        # Add color to level name
+        # Add color to level name, restoring it afterwards because the same
+        # record is passed on to the (uncolored) file handler
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        record.levelname = self._colored_levelnames.get(levelname, levelname)
         
-        return super().format(record)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def show_error_dialog(message: str, title: str = "Error") -> None:
@@ -138,6 +188,17 @@ def show_success_dialog(message: str, title: str = "Success") -> None:
     print(f"{'='*60}\n")
 
 
+# User-friendly messages for known exception types, matched along the MRO
+# so subclasses (e.g. ConnectionRefusedError) resolve without string scans
+_ERROR_MESSAGES: Dict[type, Callable[[Exception], str]] = {
+    ConnectionError: lambda e: "🔌 Can't reach the service. Is it running?",
+    TimeoutError: lambda e: "⏱️ Request timed out. Try again?",
+    FileNotFoundError: lambda e: f"📁 File not found: {e}",
+    PermissionError: lambda e: f"🔒 Permission denied: {e}",
+    json.JSONDecodeError: lambda e: "⚠️ Invalid configuration format",
+}
+
+
 def format_error_message(error: Exception) -> str:
     """
     Convert technical errors to user-friendly messages.
@@ -148,28 +209,32 @@ def format_error_message(error: Exception) -> str:
     Returns:
         User-friendly error message
     """
+    # requests.exceptions.JSONDecodeError subclasses json.JSONDecodeError but
+    # reports a bad HTTP response body, not a config problem, so requests'
+    # errors skip the type lookup (requests is only checked if already loaded)
+    requests = sys.modules.get("requests")
+    if requests is None or not isinstance(error, requests.RequestException):
+        for error_class in type(error).__mro__:
+            handler = _ERROR_MESSAGES.get(error_class)
+            if handler is not None:
+                return handler(error)
+    
+    # Third-party errors (e.g. requests.ConnectionError) don't subclass the
+    # builtins above, so fall back to matching on name and message
     error_str = str(error).lower()
     error_type = type(error).__name__
     
     # Connection errors
     if 'connection' in error_str or error_type == 'ConnectionError':
-        return "🔌 Can't reach the service. Is it running?"
+        return _ERROR_MESSAGES[ConnectionError](error)
     
     # Timeout errors
     if 'timeout' in error_str or error_type == 'TimeoutError':
-        return "⏱️ Request timed out. Try again?"
-    
-    # File not found
-    if error_type == 'FileNotFoundError':
-        return f"📁 File not found: {error}"
-    
-    # Permission errors
-    if error_type == 'PermissionError':
-        return f"🔒 Permission denied: {error}"
+        return _ERROR_MESSAGES[TimeoutError](error)
     
     # JSON errors
     if 'json' in error_str or 'parse' in error_str:
-        return "⚠️ Invalid configuration format"
+        return _ERROR_MESSAGES[json.JSONDecodeError](error)
     
     # Generic error
     return f"⚠️ Error: {str(error)[:100]}"
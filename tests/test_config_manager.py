@@ -6,6 +6,7 @@ from pathlib import Path
 import tempfile
 import os
 
+import src.config_manager as config_manager
 from src.config_manager import (
     get_default_config,
     load_config,
@@ -17,6 +18,14 @@ from src.config_manager import (
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_config_cache(tmp_path, monkeypatch):
+    """Keep the config cache out of the real ~/.cache during tests."""
+    cache_path = tmp_path / "cache" / "config_cache.json"
+    monkeypatch.setattr(config_manager, "CONFIG_CACHE_PATH", cache_path)
+    return cache_path
+
+
 def test_get_default_config():
     """Test default configuration generation."""
     config = get_default_config()
@@ -88,6 +97,106 @@ def test_save_and_load_config():
         assert loaded == config
 
 
+def test_load_config_malformed_json(tmp_path):
+    """Test that malformed JSON is backed up and replaced with defaults."""
+    config_path = tmp_path / "config.json"
+    config_path.write_bytes(b'{"window": {"width": 1280,')
+    
+    loaded = load_config(str(config_path))
+    
+    assert loaded == get_default_config()
+    assert (tmp_path / "config.json.backup").read_bytes() == b'{"window": {"width": 1280,'
+
+
+def test_load_config_uses_cache_when_unchanged(tmp_path, monkeypatch, isolated_config_cache):
+    """Test that an unchanged config file is served from the cache."""
+    config_path = tmp_path / "config.json"
+    save_config(str(config_path), get_default_config())
+    
+    first = load_config(str(config_path))
+    assert isolated_config_cache.exists()
+    
+    # A cache hit must not re-run the merge/validate pipeline
+    def fail(*args, **kwargs):
+        raise AssertionError("config was re-parsed")
+    monkeypatch.setattr(config_manager, "merge_with_defaults", fail)
+    
+    assert load_config(str(config_path)) == first
+
+
+def test_load_config_cache_invalidated_on_change(tmp_path):
+    """Test that editing the config file bypasses the stale cache."""
+    config_path = tmp_path / "config.json"
+    config = get_default_config()
+    save_config(str(config_path), config)
+    load_config(str(config_path))
+    
+    config["window"]["width"] = 800
+    save_config(str(config_path), config)
+    
+    assert load_config(str(config_path))["window"]["width"] == 800
+
+
+def test_load_config_edit_during_load_not_cached_stale(tmp_path, monkeypatch):
+    """Test that a save made mid-load is picked up by the next load."""
+    config_path = tmp_path / "config.json"
+    config = get_default_config()
+    save_config(str(config_path), config)
+
+    # Simulate the user saving config.json while validation is running
+    real_validate = config_manager.validate_config
+    def validate_and_edit(cfg):
+        edited = get_default_config()
+        edited["window"]["width"] = 999
+        save_config(str(config_path), edited)
+        real_validate(cfg)
+    monkeypatch.setattr(config_manager, "validate_config", validate_and_edit)
+
+    assert load_config(str(config_path))["window"]["width"] == 1280
+
+    monkeypatch.setattr(config_manager, "validate_config", real_validate)
+    assert load_config(str(config_path))["window"]["width"] == 999
+
+
+def test_load_config_ignores_corrupted_cache(tmp_path, isolated_config_cache):
+    """Test that a corrupted cache file falls back to parsing JSON."""
+    config_path = tmp_path / "config.json"
+    save_config(str(config_path), get_default_config())
+    
+    isolated_config_cache.parent.mkdir(parents=True)
+    isolated_config_cache.write_bytes(b"not json")
+    
+    assert load_config(str(config_path)) == get_default_config()
+
+
+def test_load_config_cache_is_plain_json(tmp_path, isolated_config_cache):
+    """Test the cache is stored as JSON rather than an executable pickle."""
+    config_path = tmp_path / "config.json"
+    save_config(str(config_path), get_default_config())
+    
+    loaded = load_config(str(config_path))
+    
+    entry = json.loads(isolated_config_cache.read_text(encoding="utf-8"))
+    assert entry["config"] == loaded
+
+
+@pytest.mark.parametrize("load_count", [1, 2])
+def test_load_config_warns_no_providers(tmp_path, caplog, load_count):
+    """Test the no-providers warning is logged on parsed and cached loads."""
+    config_path = tmp_path / "config.json"
+    config = get_default_config()
+    for provider in config["llm_providers"].values():
+        provider["enabled"] = False
+    save_config(str(config_path), config)
+    
+    for _ in range(load_count):
+        caplog.clear()
+        with caplog.at_level("WARNING", logger="pixelprompt.config"):
+            load_config(str(config_path))
+        
+        assert "No LLM providers enabled" in caplog.text
+
+
 def test_merge_with_defaults():
     """Test merging user config with defaults."""
     defaults = get_default_config()
@@ -111,6 +220,29 @@ def test_merge_with_defaults():
     assert "agents" in merged
 
 
+def test_merge_with_defaults_nested():
+    """Test that nested overrides merge without touching sibling keys."""
+    user_config = {
+        "camera": {"bounds": {"max_x": 4000}},
+        "agents": [{"id": "agent_002"}]
+    }
+    
+    merged = merge_with_defaults(user_config)
+    
+    assert merged["camera"]["bounds"]["max_x"] == 4000
+    assert merged["camera"]["bounds"]["min_x"] == 0
+    assert merged["camera"]["pan_speed"] == 5
+    
+    # Lists are replaced wholesale, not merged
+    assert merged["agents"] == [{"id": "agent_002"}]
+    
+    # User config is left untouched
+    assert user_config == {
+        "camera": {"bounds": {"max_x": 4000}},
+        "agents": [{"id": "agent_002"}]
+    }
+
+
 def test_get_window_size():
     """Test window size getter."""
     config = get_default_config()
@@ -158,14 +290,22 @@ def test_validate_config_invalid_hex_color_short():
         validate_config(config)
 
 
-def test_validate_config_valid_hex_colors():
+def test_validate_config_invalid_hex_color_trailing_newline():
+    """Test validation rejects hex colors with trailing characters."""
+    config = get_default_config()
+    config["agents"][0]["color_hex"] = "#7DCFB6\n"
+
+    with pytest.raises(ValueError, match="Invalid color hex"):
+        validate_config(config)
+
+
+@pytest.mark.parametrize("color", ["#000000", "#FFFFFF", "#7DCFB6", "#aabbcc", "#AABBCC", "#123456"])
+def test_validate_config_valid_hex_colors(color):
     """Test various valid hex color formats."""
     config = get_default_config()
+    config["agents"][0]["color_hex"] = color
 
-    valid_colors = ["#000000", "#FFFFFF", "#7DCFB6", "#aabbcc", "#AABBCC", "#123456"]
-    for color in valid_colors:
-        config["agents"][0]["color_hex"] = color
-        validate_config(config)  # Should not raise
+    validate_config(config)  # Should not raise
 
 
 def test_validate_config_invalid_spawn_position_type():
@@ -204,14 +344,13 @@ def test_validate_config_negative_spawn_position():
         validate_config(config)
 
 
-def test_validate_config_valid_spawn_positions():
+@pytest.mark.parametrize("pos", [[0, 0], [640, 360], [1000.5, 500.5], [0, 100]])
+def test_validate_config_valid_spawn_positions(pos):
     """Test various valid spawn positions."""
     config = get_default_config()
+    config["agents"][0]["spawn_position"] = pos
 
-    valid_positions = [[0, 0], [640, 360], [1000.5, 500.5], [0, 100]]
-    for pos in valid_positions:
-        config["agents"][0]["spawn_position"] = pos
-        validate_config(config)  # Should not raise
+    validate_config(config)  # Should not raise
 
 
 def test_validate_config_inverted_camera_bounds_x():
@@ -0,0 +1,265 @@
+"""Tests for Ollama provider."""
+
+import json
+
+import pytest
+
+import src.llm_providers.ollama as ollama
+from src.llm_providers.ollama import OllamaProvider, _iter_ndjson_lines
+
+
+class FakeResponse:
+    """Streamed response that returns scripted iter_content() parts."""
+
+    def __init__(self, parts, status_code=200):
+        self.parts = parts
+        self.status_code = status_code
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        yield from self.parts
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed = True
+
+
+def ndjson(*chunks):
+    """Encode chunks as one NDJSON byte string."""
+    return b"".join(json.dumps(c).encode("utf-8") + b"\n" for c in chunks)
+
+
+def token(content, done=False):
+    """Build a /api/chat stream chunk."""
+    return {"message": {"role": "assistant", "content": content}, "done": done}
+
+
+@pytest.mark.parametrize("parts, expected", [
+    # Line split across two reads
+    ([b'{"a":', b' 1}\n'], [b'{"a": 1}']),
+    # Several lines in one read
+    ([b"one\ntwo\nthree\n"], [b"one", b"two", b"three"]),
+    # Empty lines are passed through
+    ([b"one\n\n", b"\ntwo\n"], [b"one", b"", b"", b"two"]),
+    # Last line without a trailing newline
+    ([b"one\ntw", b"o"], [b"one", b"two"]),
+    # Newline arriving as its own read
+    ([b"one", b"\n", b"two\n"], [b"one", b"two"]),
+    ([], []),
+])
+def test_iter_ndjson_lines(parts, expected):
+    """Test lines are reassembled regardless of read boundaries."""
+    assert list(_iter_ndjson_lines(FakeResponse(parts))) == expected
+
+
+def test_iter_ndjson_lines_crlf():
+    """Test \\r\\n endings leave a trailing \\r the JSON parser ignores."""
+    parts = [b'{"n": 1}\r\n{"n"', b': 2}\r\n']
+
+    lines = list(_iter_ndjson_lines(FakeResponse(parts)))
+
+    assert lines == [b'{"n": 1}\r', b'{"n": 2}\r']
+    assert [ollama._json_loads(line) for line in lines] == [{"n": 1}, {"n": 2}]
+
+
+@pytest.fixture
+def provider():
+    provider = OllamaProvider()
+    yield provider
+    provider.close()
+
+
+def stream_post(monkeypatch, provider, parts):
+    """Patch the session's post() to return a scripted stream."""
+    response = FakeResponse(parts)
+    calls = []
+
+    def fake_post(url, **kwargs):
+        calls.append((url, kwargs))
+        return response
+
+    monkeypatch.setattr(provider._session, "post", fake_post)
+    return response, calls
+
+
+def test_send_message_streams_until_done(monkeypatch, provider):
+    """Test content is yielded and chunks after done are ignored."""
+    body = ndjson(token("Hel"), token("lo"), token("", done=True), token("ignored"))
+    response, calls = stream_post(monkeypatch, provider, [body[:10], body[10:]])
+
+    messages = [{"role": "user", "content": "hi"}]
+    result = list(provider.send_message(messages, "llama3.2:3b"))
+
+    assert result == ["Hel", "lo"]
+    assert response.closed
+
+    url, kwargs = calls[0]
+    assert url == "http://localhost:11434/api/chat"
+    assert kwargs["stream"] is True
+    assert json.loads(kwargs["data"]) == {
+        "model": "llama3.2:3b", "messages": messages, "stream": True
+    }
+
+
+def test_send_message_skips_unparseable_chunks(monkeypatch, provider):
+    """Test a malformed line is skipped without ending the stream."""
+    body = ndjson(token("a")) + b"{not json\n" + ndjson(token("b", done=True))
+    stream_post(monkeypatch, provider, [body])
+
+    assert list(provider.send_message([], "m")) == ["a", "b"]
+
+
+def test_send_message_truncates_chunk_count(monkeypatch, provider):
+    """Test the stream stops after MAX_RESPONSE_CHUNKS chunks."""
+    monkeypatch.setattr(ollama, "MAX_RESPONSE_CHUNKS", 3)
+    stream_post(monkeypatch, provider, [ndjson(*(token("x") for _ in range(10)))])
+
+    assert list(provider.send_message([], "m")) == ["x", "x", "x"]
+
+
+def test_send_message_truncates_length(monkeypatch, provider):
+    """Test the stream stops before exceeding MAX_RESPONSE_LENGTH chars."""
+    monkeypatch.setattr(ollama, "MAX_RESPONSE_LENGTH", 10)
+    stream_post(monkeypatch, provider, [ndjson(*(token("abcd") for _ in range(10)))])
+
+    assert list(provider.send_message([], "m")) == ["abcd", "abcd"]
+
+
+class FakeClock:
+    """Stand-in for time.monotonic() that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeTagsResponse:
+    """Non-streamed /api/tags response."""
+
+    def __init__(self, models, status_code=200):
+        self.models = models
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise ollama.requests.HTTPError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return {"models": [{"name": m} for m in self.models]}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(ollama.time, "monotonic", clock)
+    return clock
+
+
+def tags_get(monkeypatch, provider, responses):
+    """Patch the session's get() to return (or raise) scripted results."""
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append(url)
+        result = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(provider._session, "get", fake_get)
+    return calls
+
+
+def test_is_available_cached_within_ttl(monkeypatch, provider, clock):
+    """Test a repeat probe within the TTL makes no request."""
+    calls = tags_get(monkeypatch, provider, [FakeTagsResponse([])])
+
+    assert provider.is_available()
+    clock.now += ollama.AVAILABILITY_CACHE_TTL - 0.1
+    assert provider.is_available()
+
+    assert len(calls) == 1
+
+
+def test_is_available_refreshed_after_ttl(monkeypatch, provider, clock):
+    """Test a probe after the TTL hits the server again."""
+    calls = tags_get(monkeypatch, provider, [
+        FakeTagsResponse([]),
+        ollama.requests.ConnectionError("refused"),
+    ])
+
+    assert provider.is_available()
+    clock.now += ollama.AVAILABILITY_CACHE_TTL
+    assert not provider.is_available()
+
+    assert len(calls) == 2
+
+
+def test_list_models_cached_within_ttl(monkeypatch, provider, clock):
+    """Test a repeat listing within the TTL makes no request."""
+    calls = tags_get(monkeypatch, provider, [FakeTagsResponse(["a", "b"])])
+
+    assert provider.list_models() == ["a", "b"]
+    clock.now += ollama.MODELS_CACHE_TTL - 0.1
+    assert provider.list_models() == ["a", "b"]
+
+    assert len(calls) == 1
+
+
+def test_list_models_refreshed_after_ttl(monkeypatch, provider, clock):
+    """Test a listing after the TTL hits the server again."""
+    calls = tags_get(monkeypatch, provider, [
+        FakeTagsResponse(["a"]),
+        FakeTagsResponse(["a", "b"]),
+    ])
+
+    assert provider.list_models() == ["a"]
+    clock.now += ollama.MODELS_CACHE_TTL
+    assert provider.list_models() == ["a", "b"]
+
+    assert len(calls) == 2
+
+
+def test_list_models_failure_not_cached(monkeypatch, provider, clock):
+    """Test a failed listing is retried on the next call."""
+    calls = tags_get(monkeypatch, provider, [
+        ollama.requests.ConnectionError("refused"),
+        FakeTagsResponse(["a"]),
+    ])
+
+    assert provider.list_models() == []
+    assert provider.list_models() == ["a"]
+
+    assert len(calls) == 2
+
+
+def test_list_models_returns_copy(monkeypatch, provider, clock):
+    """Test callers mutating the result can't corrupt the cache."""
+    tags_get(monkeypatch, provider, [FakeTagsResponse(["a"])])
+
+    provider.list_models().append("b")
+
+    assert provider.list_models() == ["a"]
+
+
+def test_pull_model_invalidates_models_cache(monkeypatch, provider, clock):
+    """Test a successful pull forces the next listing to refetch."""
+    calls = tags_get(monkeypatch, provider, [
+        FakeTagsResponse(["a"]),
+        FakeTagsResponse(["a", "b"]),
+    ])
+    stream_post(monkeypatch, provider, [ndjson({"status": "success"})])
+
+    assert provider.list_models() == ["a"]
+    assert provider.pull_model("b")
+    assert provider._models_cache is None
+    assert provider.list_models() == ["a", "b"]
+
+    assert len(calls) == 2
@@ -0,0 +1,74 @@
+"""Tests for utils module."""
+
+import json
+import logging
+
+import pytest
+import requests
+
+import src.utils as utils
+from src.utils import format_error_message, setup_logging
+
+
+@pytest.mark.parametrize("error, expected", [
+    (ConnectionError("boom"), "🔌 Can't reach the service. Is it running?"),
+    (ConnectionRefusedError(111, "refused"), "🔌 Can't reach the service. Is it running?"),
+    (requests.ConnectionError("pool exhausted"), "🔌 Can't reach the service. Is it running?"),
+    (TimeoutError("slow"), "⏱️ Request timed out. Try again?"),
+    (RuntimeError("socket timeout"), "⏱️ Request timed out. Try again?"),
+    (FileNotFoundError("config.json"), "📁 File not found: config.json"),
+    (PermissionError("logs/"), "🔒 Permission denied: logs/"),
+    (json.JSONDecodeError("Expecting value", "", 0), "⚠️ Invalid configuration format"),
+    (ValueError("could not parse value"), "⚠️ Invalid configuration format"),
+    # A bad HTTP response body is not a config problem
+    (requests.exceptions.JSONDecodeError("Expecting value", "", 0),
+     "⚠️ Error: Expecting value: line 1 column 1 (char 0)"),
+])
+def test_format_error_message(error, expected):
+    """Test known errors map to their user-friendly messages."""
+    assert format_error_message(error) == expected
+
+
+def test_format_error_message_generic_truncated():
+    """Test unknown errors fall back to a truncated generic message."""
+    message = format_error_message(RuntimeError("x" * 200))
+    
+    assert message == "⚠️ Error: " + "x" * 100
+
+
+@pytest.fixture
+def log_dir(tmp_path, monkeypatch):
+    """Run setup_logging in a temp dir and tear its handlers down after."""
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    utils._stop_log_listener()
+    logging.getLogger("pixelprompt").handlers.clear()
+
+
+def test_setup_logging_console_keeps_print_order(log_dir, capsys):
+    """Test console log lines and print() output appear in call order."""
+    logger = setup_logging("INFO", str(log_dir / "test.log"))
+    capsys.readouterr()
+    
+    for i in range(50):
+        logger.info("log %d", i)
+        print(f"print {i}")
+    
+    lines = [line.rsplit("| ", 1)[-1] for line in capsys.readouterr().out.splitlines()]
+    
+    assert lines == [f"{kind} {i}" for i in range(50) for kind in ("log", "print")]
+
+
+def test_setup_logging_file_written_without_colors(log_dir):
+    """Test records reach the log file via the listener, uncolored."""
+    logger = setup_logging("INFO", str(log_dir / "test.log"))
+    logger.warning("disk check")
+    utils._stop_log_listener()
+    
+    contents = (log_dir / "test.log").read_text(encoding="utf-8")
+    assert "disk check" in contents
+    assert "\033[" not in contents
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])